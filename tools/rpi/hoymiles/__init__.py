@@ -7,20 +7,77 @@ Hoymiles micro-inverters python shared code
 
 import struct
 import time
-import re
 from datetime import datetime
 import json
+from collections import deque
+from functools import lru_cache
 from typing import Generator
-import crcmod
 from .rf24 import *
+from . import decoders
 from .decoders import *
-
-f_crc_m = crcmod.predefined.mkPredefinedCrcFun('modbus')
-f_crc8 = crcmod.mkCrcFun(0x101, initCrc=0, xorOut=0)
+from .decoders import f_crc_m, f_crc8
+
+try:
+    import RPi.GPIO as GPIO
+except (ModuleNotFoundError, RuntimeError):
+    GPIO = None
+
+_U8 = struct.Struct('>B')
+_U16BE = struct.Struct('>H')
+_U32BE = struct.Struct('>L')
+_U32U32U8 = struct.Struct('>LLB')
+_U32U32U8U8 = struct.Struct('>LLBB')
+
+TXPOWER_PA_LEVELS = {
+        'min': RF24_PA_MIN,
+        'low': RF24_PA_LOW,
+        'high': RF24_PA_HIGH,
+        'max': RF24_PA_MAX,
+        }
 
 HOYMILES_TRANSACTION_LOGGING=False
 HOYMILES_DEBUG_LOGGING=False
 
+# Inverter model by serial number prefix
+INVERTER_MODELS = {
+        '1121': 'Hm300',
+        '1141': 'Hm600',
+        '1161': 'Hm1200',
+        }
+
+def _response_decoders() -> dict:
+    """
+    Collect payload decoders named {model}Decode{command} from hoymiles.decoders
+
+    :return: decoder classes by (model, command) tuple
+    :rtype: dict
+    """
+    table = {}
+    for name, device in vars(decoders).items():
+        model, sep, command = name.partition('Decode')
+        if sep and model.startswith('Hm') and isinstance(device, type):
+            table[(model, command)] = device
+    return table
+
+RESPONSE_DECODERS = _response_decoders()
+
+@lru_cache(maxsize=16)
+def inverter_model_from_ser(inverter_ser: str) -> str:
+    """
+    Find decoder model for inverter serial
+
+    :param str inverter_ser: inverter serial
+    :return: suitable decoder model string
+    :rtype: str
+    :raises NotImplementedError: if inverter model can not be determined
+    """
+    ser_str = str(inverter_ser)
+    try:
+        return INVERTER_MODELS[ser_str[:4]]
+    except KeyError:
+        raise NotImplementedError(f'Model lookup failed for serial {ser_str}') from None
+
+@lru_cache(maxsize=8)
 def ser_to_hm_addr(inverter_ser: str) -> bytes:
     """
     Calculate the 4 bytes that the HM devices use in their internal messages to
@@ -31,8 +88,9 @@ def ser_to_hm_addr(inverter_ser: str) -> bytes:
     :rtype: bytes
     """
     bcd = int(str(inverter_ser)[-8:], base=16)
-    return struct.pack('>L', bcd)
+    return _U32BE.pack(bcd)
 
+@lru_cache(maxsize=8)
 def ser_to_esb_addr(inverter_ser: str) -> bytes:
     """
     Convert a Hoymiles inverter/DTU serial number into its
@@ -45,12 +103,13 @@ def ser_to_esb_addr(inverter_ser: str) -> bytes:
     digits of their serial number, in reverse byte order,
     followed by \x01.
 
+    Reversed back to library order this is \x01 followed by the HM address.
+
     :param str inverter_ser: inverter serial
     :return: ESB inverter address
     :rtype: bytes
     """
-    air_order = ser_to_hm_addr(inverter_ser)[::-1] + b'\x01'
-    return air_order[::-1]
+    return b'\x01' + ser_to_hm_addr(inverter_ser)
 
 def print_addr(inverter_ser: bytes) -> None:
     """
@@ -59,8 +118,8 @@ def print_addr(inverter_ser: bytes) -> None:
     :param str inverter_ser: inverter serial
     """
     print(f"ser# {inverter_ser} ", end='')
-    print(f" -> HM  {' '.join([f'{byte:02x}' for byte in ser_to_hm_addr(inverter_ser)])}", end='')
-    print(f" -> ESB {' '.join([f'{byte:02x}' for byte in ser_to_esb_addr(inverter_ser)])}")
+    print(f" -> HM  {hexify_payload(ser_to_hm_addr(inverter_ser))}", end='')
+    print(f" -> ESB {hexify_payload(ser_to_esb_addr(inverter_ser))}")
 
 class ResponseDecoderFactory:
     """
@@ -74,37 +133,28 @@ class ResponseDecoderFactory:
     :param time_rx: idatetime when payload was received
     :type time_rx: datetime
     """
-    model = None
-    request = None
-    response = None
-    time_rx = None
+    __slots__ = ('response', 'time_rx', 'request', 'inverter_ser', 'model')
 
     def __init__(self, response: bytes, **params) -> None:
         self.response = response
 
-        self.time_rx = params.get('time_rx', datetime.now())
+        time_rx = params.get('time_rx', None)
+        if not time_rx:
+            time_rx = datetime.now()
+        self.time_rx = time_rx
 
+        self.request = None
         if 'request' in params:
             self.request = params['request']
         elif hasattr(response, 'request'):
             self.request = response.request
 
+        self.inverter_ser = None
+        self.model = None
         if 'inverter_ser' in params:
             self.inverter_ser = params['inverter_ser']
             self.model = self.inverter_model
 
-    def unpack(self, fmt: str, base: int) -> tuple:
-        """
-        Data unpack helper
-
-        :param str fmt: struct format string
-        :param int base: unpack base position from self.response bytes
-        :return: unpacked values
-        :rtype: tuple
-        """
-        size = struct.calcsize(fmt)
-        return struct.unpack(fmt, self.response[base:base+size])
-
     @property
     def inverter_model(self) -> str:
         """
@@ -118,22 +168,7 @@ class ResponseDecoderFactory:
         if not self.inverter_ser:
             raise ValueError('Inverter serial while decoding response')
 
-        ser_db = [
-                ('Hm300', r'^1121........'),
-                ('Hm600', r'^1141........'),
-                ('Hm1200', r'^1161........'),
-                ]
-        ser_str = str(self.inverter_ser)
-
-        model = None
-        for s_model, r_match in ser_db:
-            if re.match(r_match, ser_str):
-                model = s_model
-                break
-
-        if len(model):
-            return model
-        raise NotImplementedError('Model lookup failed for serial {ser_str}')
+        return inverter_model_from_ser(self.inverter_ser)
 
     @property
     def request_command(self) -> str:
@@ -152,6 +187,8 @@ class ResponseDecoder(ResponseDecoderFactory):
 
     :param bytes response: ESB frame response
     """
+    __slots__ = ()
+
     def __init__(self, response: bytes, **params) -> None:
         """Initialize ResponseDecoder"""
         ResponseDecoderFactory.__init__(self, response, **params)
@@ -166,12 +203,9 @@ class ResponseDecoder(ResponseDecoderFactory):
         model = self.inverter_model
         command = self.request_command
 
-        model_decoders = __import__('hoymiles.decoders')
-        if hasattr(model_decoders, f'{model}Decode{command.upper()}'):
-            device = getattr(model_decoders, f'{model}Decode{command.upper()}')
-        else:
-            if HOYMILES_DEBUG_LOGGING:
-                device = getattr(model_decoders, 'DebugDecodeAny')
+        device = RESPONSE_DECODERS.get((model, command.upper()))
+        if not device:
+            device = DebugDecodeAny if HOYMILES_DEBUG_LOGGING else UnknownResponse
 
         return device(self.response,
                 time_rx=self.time_rx,
@@ -180,6 +214,8 @@ class ResponseDecoder(ResponseDecoderFactory):
 
 class InverterPacketFragment:
     """ESB Frame"""
+    __slots__ = ('time_rx', 'frame', 'ch_rx', 'ch_tx', 'main_cmd', 'src', 'dst', 'seq', 'data')
+
     def __init__(self, time_rx: datetime = None, payload: bytes = None, ch_rx: int = None, ch_tx: int = None, **params) -> None:
         """
         Callback: get's invoked whenever a Nordic ESB packet has been received.
@@ -202,6 +238,10 @@ class InverterPacketFragment:
 
         self.frame = payload
 
+        # main_cmd, src, dst, seq and crc8 at least
+        if len(payload) < 11:
+            raise BufferError(f'Frame too short: {len(payload)} bytes')
+
         # check crc8
         if f_crc8(payload[:-1]) != payload[-1]:
             raise BufferError('Frame kaputt')
@@ -209,50 +249,11 @@ class InverterPacketFragment:
         self.ch_rx = ch_rx
         self.ch_tx = ch_tx
 
-    @property
-    def main_cmd(self) -> int:
-        """Transaction counter"""
-        return self.frame[0]
-
-    @property
-    def src(self) -> int:
-        """
-        Sender adddress
-
-        :return: sender address
-        :rtype: int
-        """
-        src = struct.unpack('>L', self.frame[1:5])
-        return src[0]
-    @property
-    def dst(self) -> int:
-        """
-        Receiver adddress
-
-        :return: receiver address
-        :rtype: int
-        """
-        dst = struct.unpack('>L', self.frame[5:8])
-        return dst[0]
-    @property
-    def seq(self) -> int:
-        """
-        Framne sequence number
-
-        :return: sequence number
-        :rtype: int
-        """
-        result = struct.unpack('>B', self.frame[9:10])
-        return result[0]
-    @property
-    def data(self) -> bytes:
-        """
-        Data without protocol framing
-
-        :return: payload chunk
-        :rtype: bytes
-        """
-        return self.frame[10:-1]
+        # Decode protocol framing once, fragments get inspected repeatedly
+        # while reassembling the payload
+        self.main_cmd = payload[0]
+        self.src, self.dst, self.seq = _U32U32U8.unpack_from(payload, 1)
+        self.data = payload[10:-1]
 
     def __str__(self) -> str:
         """
@@ -261,10 +262,10 @@ class InverterPacketFragment:
         :return: log line received frame
         :rtype: str
         """
-        c_datetime = self.time_rx.strftime("%Y-%m-%d %H:%M:%S.%f")
+        c_datetime = self.time_rx.isoformat(" ", "microseconds")
         size = len(self.frame)
         channel = f' channel {self.ch_rx}' if self.ch_rx else ''
-        raw = " ".join([f"{b:02x}" for b in self.frame])
+        raw = hexify_payload(self.frame)
         return f"{c_datetime} Received {size} bytes{channel}: {raw}"
 
 class HoymilesNRF:
@@ -275,13 +276,18 @@ class HoymilesNRF:
     rx_channel_list = [3,23,40,61,75]
     rx_channel_ack = False
     rx_error = 0
+    rx_poll_interval = 0.005
     txpower = 'max'
+    irq_pin = None
 
     def __init__(self, **radio_config) -> None:
         """
         Claim radio device
 
         :param NRF24 device: instance of NRF24
+        :param irq_pin: optional GPIO (BCM) wired to the nRF24 IRQ line
+        :type irq_pin: int
+        :raises RuntimeError: if radio or irq_pin can not be set up
         """
         radio = RF24(
                 radio_config.get('ce_pin', 22),
@@ -294,6 +300,15 @@ class HoymilesNRF:
         self.txpower = radio_config.get('txpower', 'max')
 
         self.radio = radio
+        self.radio_settings = {}
+
+        irq_pin = radio_config.get('irq_pin', None)
+        if irq_pin is not None:
+            if not GPIO:
+                raise RuntimeError('irq_pin requires RPi.GPIO')
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(irq_pin, GPIO.IN)
+            self.irq_pin = irq_pin
 
     def transmit(self, packet: bytes, txpower: int = None) -> bool:
         """
@@ -311,23 +326,15 @@ class HoymilesNRF:
         dtu_esb_addr = b'\01' + packet[5:9]
 
         self.radio.stopListening()  # put radio in TX mode
-        self.radio.setDataRate(RF24_250KBPS)
-        self.radio.openReadingPipe(1,dtu_esb_addr)
-        self.radio.openWritingPipe(inv_esb_addr)
-        self.radio.setChannel(self.tx_channel)
-        self.radio.setAutoAck(True)
-        self.radio.setRetries(3, 15)
-        self.radio.setCRCLength(RF24_CRC_16)
-        self.radio.enableDynamicPayloads()
-
-        if txpower == 'min':
-            self.radio.setPALevel(RF24_PA_MIN)
-        elif txpower == 'low':
-            self.radio.setPALevel(RF24_PA_LOW)
-        elif txpower == 'high':
-            self.radio.setPALevel(RF24_PA_HIGH)
-        else:
-            self.radio.setPALevel(RF24_PA_MAX)
+        self.radio_set('setDataRate', RF24_250KBPS)
+        self.radio_set('openReadingPipe', 1, dtu_esb_addr)
+        self.radio_set('openWritingPipe', inv_esb_addr)
+        self.radio_set('setChannel', self.tx_channel)
+        self.radio_set('setAutoAck', True)
+        self.radio_set('setRetries', 3, 15)
+        self.radio_set('setCRCLength', RF24_CRC_16)
+        self.radio_set('enableDynamicPayloads')
+        self.radio_set('setPALevel', TXPOWER_PA_LEVELS.get(txpower, RF24_PA_MAX))
 
         if hasattr(self.radio, 'send'):
             res = self.radio.send(packet)
@@ -347,36 +354,42 @@ class HoymilesNRF:
         if not timeout:
             timeout=12e8
 
-        self.radio.setChannel(self.rx_channel)
-        self.radio.setAutoAck(False)
-        self.radio.setRetries(0, 0)
-        self.radio.enableDynamicPayloads()
-        self.radio.setCRCLength(RF24_CRC_16)
+        self.radio_set('setChannel', self.rx_channel)
+        self.radio_set('setAutoAck', False)
+        self.radio_set('setRetries', 0, 0)
+        self.radio_set('enableDynamicPayloads')
+        self.radio_set('setCRCLength', RF24_CRC_16)
         self.radio.startListening()
 
-        fragments = []
-
         # Receive: Loop
-        t_end = time.monotonic_ns()+timeout
-        while time.monotonic_ns() < t_end:
+        t_end = time.monotonic() + timeout / 1e9
+        while time.monotonic() < t_end:
 
             has_payload, pipe_number = self.radio.available_pipe()
             if has_payload:
 
-                # Data in nRF24 buffer, read it
+                # Data in nRF24 buffer, read until rx fifo is drained
                 self.rx_error = 0
                 self.rx_channel_ack = True
-                t_end = time.monotonic_ns()+5e8
-
-                size = self.radio.getDynamicPayloadSize()
-                payload = self.radio.read(size)
-                fragment = InverterPacketFragment(
-                        payload=payload,
-                        ch_rx=self.rx_channel, ch_tx=self.tx_channel,
-                        time_rx=datetime.now()
-                        )
-
-                yield fragment
+                t_end = time.monotonic() + 0.5
+
+                while has_payload:
+                    size = self.radio.getDynamicPayloadSize()
+                    payload = self.radio.read(size)
+                    try:
+                        fragment = InverterPacketFragment(
+                                payload=payload,
+                                ch_rx=self.rx_channel, ch_tx=self.tx_channel,
+                                time_rx=datetime.now()
+                                )
+                    except BufferError as e_buf:
+                        # Corrupt frame, drop it, get_payload() asks for a retransmit
+                        if HOYMILES_DEBUG_LOGGING:
+                            print(f'Debug: {e_buf}: {hexify_payload(payload)}')
+                    else:
+                        yield fragment
+
+                    has_payload, pipe_number = self.radio.available_pipe()
 
             else:
 
@@ -388,10 +401,39 @@ class HoymilesNRF:
                 # Channel hopping
                 if self.next_rx_channel():
                     self.radio.stopListening()
-                    self.radio.setChannel(self.rx_channel)
+                    self.radio_set('setChannel', self.rx_channel)
                     self.radio.startListening()
 
-            time.sleep(0.005)
+            # Wait before polling again, also after a drained burst so an
+            # empty fifo right after the last fragment doesn't count as miss
+            self.wait_rx(t_end)
+
+    def radio_set(self, setter: str, *args) -> None:
+        """
+        Apply radio setting, skip the SPI transfer if it is already applied
+
+        :param str setter: name of the RF24 setter method
+        :param args: setter arguments
+        """
+        if self.radio_settings.get(setter) != args:
+            getattr(self.radio, setter)(*args)
+            self.radio_settings[setter] = args
+
+    def wait_rx(self, t_end: float) -> None:
+        """
+        Idle until the next rx poll, returns early on nRF24 IRQ (RX_DR) if
+        irq_pin is set up
+
+        :param float t_end: time.monotonic() deadline of current receive
+        """
+        t_wait = min(self.rx_poll_interval, t_end - time.monotonic())
+        if t_wait <= 0:
+            return
+
+        if self.irq_pin is not None and GPIO:
+            GPIO.wait_for_edge(self.irq_pin, GPIO.FALLING, timeout=max(1, int(t_wait * 1000)))
+        else:
+            time.sleep(t_wait)
 
     def next_rx_channel(self) -> bool:
         """
@@ -431,6 +473,8 @@ class HoymilesNRF:
 
     def __del__(self):
         self.radio.powerDown()
+        if self.irq_pin is not None:
+            GPIO.cleanup(self.irq_pin)
 
 def frame_payload(payload: bytes) -> bytes:
     """
@@ -441,7 +485,7 @@ def frame_payload(payload: bytes) -> bytes:
     :rtype: bytes
     """
     payload_crc = f_crc_m(payload)
-    payload = payload + struct.pack('>H', payload_crc)
+    payload = payload + _U16BE.pack(payload_crc)
 
     return payload
 
@@ -464,17 +508,15 @@ def compose_esb_fragment(fragment: bytes, maincmd: bytes = b'\x15', subcmd: byte
     if len(fragment) > 17:
         raise ValueError(f'ESB fragment exeeds mtu: Fragment size {len(fragment)} bytes')
 
-    packet = b'' + maincmd
-    packet = packet + ser_to_hm_addr(dst)
-    packet = packet + ser_to_hm_addr(src)
-    packet = packet + subcmd
+    packet = bytearray(maincmd)
+    packet += ser_to_hm_addr(dst)
+    packet += ser_to_hm_addr(src)
+    packet += subcmd
+    packet += fragment
 
-    packet = packet + fragment
+    packet.append(f_crc8(packet))
 
-    crc8 = f_crc8(packet)
-    packet = packet + struct.pack('B', crc8)
-
-    return packet
+    return bytes(packet)
 
 def compose_esb_packet(packet: bytes, mtu: int = 17, **params) -> Generator[bytes, None, None]:
     """
@@ -485,8 +527,9 @@ def compose_esb_packet(packet: bytes, mtu: int = 17, **params) -> Generator[byte
     :type mtu: int
     :yields: fragment
     """
+    packet_view = memoryview(packet)
     for i in range(0, len(packet), mtu):
-        fragment = compose_esb_fragment(packet[i:i+mtu], **params)
+        fragment = compose_esb_fragment(packet_view[i:i+mtu], **params)
         yield fragment
 
 class ESBFrame:
@@ -536,19 +579,20 @@ class ESBFrame:
 
     @property
     def packet(self) -> bytes:
-        packet = self.preamble
-        packet = packet + self.target
-        packet = packet + self.source
-        packet = packet + self.payload
-        return packet
+        return b''.join((self.preamble, self.target, self.source, self.payload))
 
     @property
     def crc(self) -> bytes:
         crc8 = f_crc8(self.packet)
-        return struct.pack('B', crc8)
+        return _U8.pack(crc8)
 
     def __bytes__(self) -> bytes:
-        return self.packet + self.crc
+        packet = bytearray(self.preamble)
+        packet += self.target
+        packet += self.source
+        packet += self.payload
+        packet.append(f_crc8(packet))
+        return bytes(packet)
 
     def __repr__(self) -> str:
         return hexify_payload(self.__bytes__())
@@ -592,23 +636,26 @@ class RequestFactory:
     @property
     def crc(self) -> bytes:
         crc = f_crc_m(self._payload)
-        return struct.pack('>H', crc)
+        return _U16BE.pack(crc)
 
     def __iter__(self) -> Generator[ESBFrame, None, None]:
         n_frame = 0x00
-        payload = self._payload + self.crc
+        payload = memoryview(self._payload + self.crc)
         l_payload = len(payload)
         for i_base in range(0, l_payload, self._mtu):
             n_frame = n_frame + 0x01
             if i_base + self._mtu >= l_payload:
                 n_frame = n_frame + 0x80
-            subcmd = struct.pack('>B', n_frame)
+            subcmd = _U8.pack(n_frame)
             yield ESBFrame(
                     preamble=self._maincmd,
                     source=self._source,
                     target=self._target,
                     payload=subcmd + payload[i_base:i_base+self._mtu])
 
+_SET_TIME_PREFIX = b'\x0b\x00'
+_SET_TIME_SUFFIX = b'\x00\x00\x00\x05\x00\x00\x00\x00'
+
 def compose_set_time_payload(timestamp: int = None) -> bytes:
     """
     Build set time request packet
@@ -621,9 +668,8 @@ def compose_set_time_payload(timestamp: int = None) -> bytes:
     if not timestamp:
         timestamp = int(time.time())
 
-    payload = b'\x0b\x00'
-    payload = payload + struct.pack('>L', timestamp)  # big-endian: msb at low address
-    payload = payload + b'\x00\x00\x00\x05\x00\x00\x00\x00'
+    # timestamp big-endian: msb at low address
+    payload = b''.join((_SET_TIME_PREFIX, _U32BE.pack(timestamp), _SET_TIME_SUFFIX))
 
     return frame_payload(payload)
 
@@ -632,8 +678,6 @@ class InverterTransaction:
     Inverter transaction buffer, implements transport-layer functions while
     communicating with Hoymiles inverters
     """
-    tx_queue = []
-    scratch = []
     inverter_ser = None
     inverter_addr = None
     dtu_ser = None
@@ -671,6 +715,8 @@ class InverterTransaction:
         if not request_time:
             request_time=datetime.now()
 
+        self.tx_queue = deque()
+
         self.scratch = []
         if 'scratch' in params:
             self.scratch = params['scratch']
@@ -687,7 +733,7 @@ class InverterTransaction:
         if 'request' in params:
             self.request = params['request']
             self.queue_tx(self.request)
-            self.inverter_addr, self.dtu_addr, seq, self.req_type = struct.unpack('>LLBB', params['request'][1:11])
+            self.inverter_addr, self.dtu_addr, seq, self.req_type = _U32U32U8U8.unpack_from(params['request'], 1)
         self.request_time = request_time
 
     def rxtx(self) -> bool:
@@ -698,27 +744,31 @@ class InverterTransaction:
         :return: if we got contact
         :rtype: bool
         """
-        if not self.radio:
+        radio = self.radio
+        if not radio:
             return False
 
-        if len(self.tx_queue) == 0:
+        tx_queue = self.tx_queue
+        if len(tx_queue) == 0:
             return False
 
-        packet = self.tx_queue.pop(0)
+        packet = tx_queue.popleft()
 
-        if HOYMILES_TRANSACTION_LOGGING:
-            c_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        log_tx = HOYMILES_TRANSACTION_LOGGING
+        if log_tx:
+            c_datetime = datetime.now().isoformat(" ", "microseconds")
             print(f'{c_datetime} Transmit {len(packet)} | {hexify_payload(packet)}')
 
-        self.radio.transmit(packet, txpower=self.txpower)
+        radio.transmit(packet, txpower=self.txpower)
 
+        frame_append = self.frame_append
         wait = False
         try:
-            for response in self.radio.receive():
-                if HOYMILES_TRANSACTION_LOGGING:
+            for response in radio.receive():
+                if log_tx:
                     print(response)
 
-                self.frame_append(response)
+                frame_append(response)
                 wait = True
         except TimeoutError:
             pass
@@ -764,35 +814,36 @@ class InverterTransaction:
         if not src:
             src = self.inverter_addr
 
-        # Collect all frames from source_address src
-        frames = [frame for frame in self.scratch if frame.src == src]
+        # Collect all frames from source_address src by sequence number
+        frames = {frame.seq: frame for frame in self.scratch if frame.src == src}
 
         tr_len = 0
         # Find end frame and extract message frame count
         try:
-            end_frame = next(frame for frame in frames if frame.seq > 0x80)
+            end_frame = next(frame for seq, frame in frames.items() if seq > 0x80)
             self.time_rx = end_frame.time_rx
             tr_len = end_frame.seq - 0x80
         except StopIteration:
-            seq_last = max(frames, key=lambda frame:frame.seq).seq
+            seq_last = max(frames, default=0)
             self.__retransmit_frame(seq_last + 1)
             raise BufferError(f'Missing packet: Last packet {len(self.scratch)}')
 
         # Rebuild payload from unordered frames
-        payload = b''
+        chunks = []
         for frame_id in range(1, tr_len):
             try:
-                data_frame = next(item for item in frames if item.seq == frame_id)
-                payload = payload + data_frame.data
-            except StopIteration:
+                chunks.append(frames[frame_id].data)
+            except KeyError:
                 self.__retransmit_frame(frame_id)
-                raise BufferError(f'Frame {frame_id} missing: Request Retransmit')
+                raise BufferError(f'Frame {frame_id} missing: Request Retransmit') from None
 
-        payload = payload + end_frame.data
+        chunks.append(end_frame.data)
+        payload = b''.join(chunks)
 
-        # check crc
-        pcrc = struct.unpack('>H', payload[-2:])[0]
-        if f_crc_m(payload[:-2]) != pcrc:
+        # check crc, without copying payload body or crc
+        l_body = len(payload) - 2
+        pcrc = _U16BE.unpack_from(payload, l_body)[0]
+        if f_crc_m(memoryview(payload)[:l_body]) != pcrc:
             raise ValueError('Payload failed CRC check.')
 
         return (end_frame.main_cmd, payload,)
@@ -823,7 +874,7 @@ class InverterTransaction:
         :return: log line of payload for transmission
         :rtype: str
         """
-        c_datetime = self.request_time.strftime("%Y-%m-%d %H:%M:%S.%f")
+        c_datetime = self.request_time.isoformat(" ", "microseconds")
         size = len(self.request)
         return f'{c_datetime} Transmit | {hexify_payload(self.request)}'
 
@@ -835,4 +886,4 @@ def hexify_payload(byte_var: bytes) -> str:
     :return: two-byte while-space padded byte representation
     :rtype: str
     """
-    return ' '.join([f"{b:02x}" for b in byte_var])
+    return byte_var.hex(' ')
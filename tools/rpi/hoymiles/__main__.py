@@ -16,6 +16,13 @@ from yaml.loader import SafeLoader
 import paho.mqtt.client
 import hoymiles
 
+# Raw mqtt command payloads, hexlified
+HEX_PAYLOAD_RE = re.compile(r'[0-9a-f]+')
+
+# Verbose output of decoded StatusResponse channels
+DEBUG_PHASE_FMT = ' phase{0}=voltage:{voltage}, current:{current}, power:{power}, frequency:{frequency}'
+DEBUG_STRING_FMT = ' string{0}=voltage:{voltage}, current:{current}, power:{power}, total:{total}, daily:{energy_daily}'
+
 def main_loop():
     """Main loop"""
     inverters = [
@@ -37,6 +44,7 @@ def poll_inverter(inverter, retries=4):
     """
     inverter_ser = inverter.get('serial')
     dtu_ser = ahoy_config.get('dtu', {}).get('serial')
+    debug = hoymiles.HOYMILES_DEBUG_LOGGING
 
     # Queue at least status data request
     command_queue[str(inverter_ser)].append(hoymiles.compose_set_time_payload())
@@ -45,6 +53,15 @@ def poll_inverter(inverter, retries=4):
     while len(command_queue[str(inverter_ser)]) > 0:
         payload = command_queue[str(inverter_ser)].pop(0)
 
+        # Compose the request once, retries resend the same packet
+        request = next(hoymiles.compose_esb_packet(
+            payload,
+            maincmd=b'\x15',
+            subcmd=b'\x80',
+            src=dtu_ser,
+            dst=inverter_ser
+            ))
+
         # Send payload {ttl}-times until we get at least one reponse
         payload_ttl = retries
         while payload_ttl > 0:
@@ -54,21 +71,18 @@ def poll_inverter(inverter, retries=4):
                     txpower=inverter.get('txpower', None),
                     dtu_ser=dtu_ser,
                     inverter_ser=inverter_ser,
-                    request=next(hoymiles.compose_esb_packet(
-                        payload,
-                        maincmd=b'\x15',
-                        subcmd=b'\x80',
-                        src=dtu_ser,
-                        dst=inverter_ser
-                        )))
+                    request=request)
             response = None
             while com.rxtx():
                 try:
                     main_cmd, response = com.get_payload()
                     payload_ttl = 0
+                except BufferError as e_buf:
+                    # Frames still missing, expected until the response is complete
+                    if debug:
+                        print(f'Debug: {e_buf}')
                 except Exception as e_all:
                     print(f'Error while retrieving data: {e_all}')
-                    pass
 
         # Handle the response data if any
         if response:
@@ -85,19 +99,17 @@ def poll_inverter(inverter, retries=4):
 
             if isinstance(result, hoymiles.decoders.StatusResponse):
                 data = result.__dict__()
-                if hoymiles.HOYMILES_DEBUG_LOGGING:
-                    print(f'{c_datetime} Decoded: temp={data["temperature"]}', end='')
+                if debug:
+                    decoded = [f'{c_datetime} Decoded: temp={data["temperature"]}']
                     if data['powerfactor'] is not None:
-                        print(f', pf={data["powerfactor"]}', end='')
-                    phase_id = 0
-                    for phase in data['phases']:
-                        print(f' phase{phase_id}=voltage:{phase["voltage"]}, current:{phase["current"]}, power:{phase["power"]}, frequency:{data["frequency"]}', end='')
-                        phase_id = phase_id + 1
-                    string_id = 0
-                    for string in data['strings']:
-                        print(f' string{string_id}=voltage:{string["voltage"]}, current:{string["current"]}, power:{string["power"]}, total:{string["energy_total"]/1000}, daily:{string["energy_daily"]}', end='')
-                        string_id = string_id + 1
-                    print()
+                        decoded.append(f', pf={data["powerfactor"]}')
+                    decoded.extend(
+                            DEBUG_PHASE_FMT.format(phase_id, frequency=data['frequency'], **phase)
+                            for phase_id, phase in enumerate(data['phases']))
+                    decoded.extend(
+                            DEBUG_STRING_FMT.format(string_id, total=string['energy_total']/1000, **string)
+                            for string_id, string in enumerate(data['strings']))
+                    print(''.join(decoded))
 
                 if mqtt_client:
                     mqtt_send_status(mqtt_client, inverter_ser, data,
@@ -174,12 +186,12 @@ def mqtt_on_command(client, userdata, message):
         p_message = message.payload.decode('utf-8').lower()
 
         # Expand tttttttt to current time for use in hexlified payload
-        expand_time = ''.join(f'{b:02x}' for b in struct.pack('>L', int(time.time())))
+        expand_time = struct.pack('>L', int(time.time())).hex()
         p_message = p_message.replace('tttttttt', expand_time)
 
         if (len(p_message) < 2048 \
             and len(p_message) % 2 == 0 \
-            and re.match(r'^[a-f0-9]+$', p_message)):
+            and HEX_PAYLOAD_RE.fullmatch(p_message)):
             payload = bytes.fromhex(p_message)
             # commands must start with \x80
             if payload[0] == 0x80:
@@ -270,7 +282,7 @@ if __name__ == '__main__':
 
             main_loop()
 
-            print('', end='', flush=True)
+            sys.stdout.flush()
 
             if loop_interval > 0 and (time.time() - t_loop_start) < loop_interval:
                 time.sleep(loop_interval - (time.time() - t_loop_start))
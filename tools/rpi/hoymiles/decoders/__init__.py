@@ -6,35 +6,142 @@ Hoymiles Micro-Inverters decoder library
 """
 
 import struct
+from array import array
+from functools import reduce
+from operator import xor
+from types import MappingProxyType
 from datetime import datetime, timedelta, timezone
-import crcmod
 
-f_crc_m = crcmod.predefined.mkPredefinedCrcFun('modbus')
-f_crc8 = crcmod.mkCrcFun(0x101, initCrc=0, xorOut=0)
+# crcmod only pays off with its C extension, python fallbacks below are faster
+try:
+    import crcmod
+    import crcmod._crcfunext
+    import crcmod.predefined
+except ImportError:
+    crcmod = None
+
+def _crc_m_tables():
+    """
+    Build slice-by-8 lookup tables for the reflected Modbus CRC16 (poly 0xA001)
+
+    Table n holds the crc contribution of a byte followed by n zero bytes.
+
+    :return: 8 tables of 256 crc values each
+    :rtype: tuple
+    """
+    table = array('H')
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 0x01 else crc >> 1
+        table.append(crc)
+
+    tables = [table]
+    for _ in range(7):
+        tables.append(array('H', [(crc >> 8) ^ table[crc & 0xFF] for crc in tables[-1]]))
+    return tuple(tables)
+
+CRC_M_TABLES = _crc_m_tables()
+
+_U8X8 = struct.Struct('8B')
+
+def crc_m_slice8(data, _tables=CRC_M_TABLES):
+    """
+    Modbus CRC16, pure python slice-by-8 implementation
+
+    :param bytes data: data to checksum
+    :return: crc
+    :rtype: int
+    """
+    t_0, t_1, t_2, t_3, t_4, t_5, t_6, t_7 = _tables
+    crc = 0xFFFF
+    l_fast = len(data) & ~0x07
+    for b_0, b_1, b_2, b_3, b_4, b_5, b_6, b_7 in _U8X8.iter_unpack(data[:l_fast]):
+        crc ^= b_0 | b_1 << 8
+        crc = t_7[crc & 0xFF] ^ t_6[crc >> 8] ^ t_5[b_2] ^ t_4[b_3] \
+                ^ t_3[b_4] ^ t_2[b_5] ^ t_1[b_6] ^ t_0[b_7]
+    for byte in data[l_fast:]:
+        crc = (crc >> 8) ^ t_0[(crc ^ byte) & 0xFF]
+    return crc
+
+def crc8_xor(data):
+    """
+    Hoymiles ESB frame CRC8 (poly 0x101, init 0x00), pure python implementation
+
+    The polynomial x^8+1 turns each bit step into a rotate of the 8 bit
+    register, so the byte-wise lookup table is the identity and the crc is
+    the XOR of all bytes.
+
+    :param bytes data: data to checksum
+    :return: crc
+    :rtype: int
+    """
+    return reduce(xor, data, 0)
+
+# Use the fastest Modbus CRC available: fastcrc (native, SIMD), crcmod's
+# C extension, pure python otherwise
+try:
+    from fastcrc import crc16
+    f_crc_m = crc16.modbus
+except ImportError:
+    if crcmod:
+        f_crc_m = crcmod.predefined.mkPredefinedCrcFun('modbus')
+    else:
+        f_crc_m = crc_m_slice8
+
+if crcmod:
+    f_crc8 = crcmod.mkCrcFun(0x101, initCrc=0, xorOut=0)
+else:
+    f_crc8 = crc8_xor
+
+# Check selected and fallback implementations against known vectors, the
+# catalogue check value of b'123456789' and every byte value at every
+# slice position, a broken table must not go unnoticed
+_crc_bytes = bytes(range(256))
+_crc_slices = b''.join(_crc_bytes[n:] + _crc_bytes[:n] for n in range(8))
+for _crc_fun, _crc_data, _crc_check in (
+        (f_crc_m, b'123456789', 0x4B37),
+        (crc_m_slice8, b'123456789', 0x4B37),
+        (crc_m_slice8, _crc_slices, 0xFAB2),
+        (f_crc8, b'123456789', 0x31),
+        (crc8_xor, b'123456789', 0x31)):
+    if _crc_fun(_crc_data) != _crc_check:
+        raise RuntimeError(f'CRC self test failed: {_crc_fun!r}')
+del _crc_bytes, _crc_slices, _crc_fun, _crc_data, _crc_check
+
+_U8 = struct.Struct('>B')
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>L')
+_EV_HDR = struct.Struct('>BBHHH')
+_EV_FULL = struct.Struct('>BBHHHHH')
+
+# bytes.translate table, printable ascii passes, everything else becomes '.'
+_PRINTABLE_TBL = bytes(c if 32 <= c < 127 else ord('.') for c in range(256))
 
 def g_unpack(s_fmt, s_buf):
     """Chunk unpack helper
 
-    :param s_fmt: struct format string
-    :type s_fmt: str
+    :param s_fmt: struct format string or compiled struct
+    :type s_fmt: str or struct.Struct
     :param s_buf: buffer to unpack
-    :type s_buf: bytes
+    :type s_buf: bytes-like object
     :return: decoded data iterator
     :rtype: generator object
     """
 
-    cs = struct.calcsize(s_fmt)
-    s_exc = len(s_buf) % cs
+    s_struct = s_fmt if isinstance(s_fmt, struct.Struct) else struct.Struct(s_fmt)
+    s_buf = memoryview(s_buf)
+    s_exc = len(s_buf) % s_struct.size
 
-    return struct.iter_unpack(s_fmt, s_buf[:len(s_buf) - s_exc])
+    return s_struct.iter_unpack(s_buf[:len(s_buf) - s_exc])
 
 def print_table_unpack(s_fmt, payload, cw=6):
     """
     Print table of decoded numbers with different offsets
     Helps recognizing values in unknown payloads
 
-    :param s_fmt: struct format string
-    :type s_fmt: str
+    :param s_fmt: struct format string or compiled struct
+    :type s_fmt: str or struct.Struct
     :param payload: bytes data
     :type payload: bytes
     :param cw: cell width
@@ -42,20 +149,22 @@ def print_table_unpack(s_fmt, payload, cw=6):
     :return: None
     """
 
-    l_hexlified = [f'{byte:02x}' for byte in payload]
+    l_hexlified = payload.hex(' ').split(' ') if payload else []
 
     print(f'{"Pos": <{cw}}', end='')
     print(''.join([f'{num: >{cw}}' for num in range(0, len(payload))]))
     print(f'{"Hex": <{cw}}', end='')
     print(''.join([f'{byte: >{cw}}' for byte in l_hexlified]))
 
-    l_fmt = struct.calcsize(s_fmt)
+    s_struct = s_fmt if isinstance(s_fmt, struct.Struct) else struct.Struct(s_fmt)
+    l_fmt = s_struct.size
     if len(payload) >= l_fmt:
+        view = memoryview(payload)
         for offset in range(0, l_fmt):
-            print(f'{s_fmt: <{cw}}', end='')
+            print(f'{s_struct.format: <{cw}}', end='')
             print(' ' * cw * offset, end='')
             print(''.join(
-                [f'{num[0]: >{cw*l_fmt}}' for num in g_unpack(s_fmt, payload[offset:])]))
+                [f'{num: >{cw*l_fmt}}' for num, in g_unpack(s_struct, view[offset:])]))
 
 class Response:
     """ All Response Shared methods """
@@ -74,8 +183,10 @@ class Response:
 
         self.response = args[0]
 
-        if isinstance(params.get('time_rx', None), datetime):
-            self.time_rx = params['time_rx']
+        # callers pass the reception time, only fall back to the clock
+        time_rx = params.get('time_rx', None)
+        if isinstance(time_rx, datetime):
+            self.time_rx = time_rx
         else:
             self.time_rx = datetime.now()
 
@@ -89,10 +200,34 @@ class Response:
 class StatusResponse(Response):
     """Inverter StatusResponse object"""
     e_keys  = ['voltage','current','power','energy_total','energy_daily','powerfactor']
-    temperature = None
-    frequency = None
-    powerfactor = None
-    event_count = None
+    g_keys = ('temperature', 'frequency', 'powerfactor', 'event_count')
+
+    n_phases = 0
+    n_strings = 0
+
+    # Decoded values by attribute name: (struct, offset in response, divisor)
+    _fields = MappingProxyType({})
+
+    def __getattr__(self, name):
+        """
+        Decode status value from self.response
+
+        :param str name: value name, one of self._fields
+        :return: decoded value, None for inverter global values not provided by the model
+        :rtype: float or int or None
+        :raises AttributeError: if name is no known value
+        """
+        try:
+            s_field, base, div = type(self)._fields[name]
+        except KeyError:
+            if name in self.g_keys:
+                return None
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}') from None
+
+        value = s_field.unpack_from(self.response, base)[0]
+        if div:
+            return value / div
+        return value
 
     def unpack(self, fmt, base):
         """
@@ -114,21 +249,7 @@ class StatusResponse(Response):
         :retrun: list of dict's
         :rtype: list
         """
-        phases = []
-        p_exists = True
-        while p_exists:
-            p_exists = False
-            phase_id = len(phases)
-            phase = {}
-            for key in self.e_keys:
-                prop = f'ac_{key}_{phase_id}'
-                if hasattr(self, prop):
-                    p_exists = True
-                    phase[key] = getattr(self, prop)
-            if p_exists:
-                phases.append(phase)
-
-        return phases
+        return self._channels('ac', self.n_phases)
 
     @property
     def strings(self):
@@ -138,21 +259,27 @@ class StatusResponse(Response):
         :retrun: list of dict's
         :rtype: list
         """
-        strings = []
-        s_exists = True
-        while s_exists:
-            s_exists = False
-            string_id = len(strings)
-            string = {}
-            for key in self.e_keys:
-                prop = f'dc_{key}_{string_id}'
-                if hasattr(self, prop):
-                    s_exists = True
-                    string[key] = getattr(self, prop)
-            if s_exists:
-                strings.append(string)
+        return self._channels('dc', self.n_strings)
 
-        return strings
+    def _channels(self, prefix, n_channels):
+        """
+        Collect e_keys values per phase or string
+
+        :param str prefix: ac for phases, dc for strings
+        :param int n_channels: number of phases or strings
+        :return: list of dict's
+        :rtype: list
+        """
+        fields = self._fields
+        channels = []
+        for channel_id in range(n_channels):
+            channel = {}
+            for key in self.e_keys:
+                prop = f'{prefix}_{key}_{channel_id}'
+                if prop in fields:
+                    channel[key] = getattr(self, prop)
+            channels.append(channel)
+        return channels
 
     def __dict__(self):
         """
@@ -184,7 +311,7 @@ class UnknownResponse(Response):
         :return: hexlifierd byte string
         :rtype: str
         """
-        return ' '.join([f'{byte:02x}' for byte in self.response])
+        return self.response.hex(' ')
 
     def validate_crc8(self):
         """
@@ -194,8 +321,9 @@ class UnknownResponse(Response):
         :rtype: bool
         """
         # check crc
-        pcrc = struct.unpack('>B', self.response[-1:])[0]
-        return f_crc8(self.response[:-1]) == pcrc
+        if not self.response:
+            return False
+        return f_crc8(memoryview(self.response)[:-1]) == self.response[-1]
 
     def validate_crc_m(self):
         """
@@ -205,8 +333,10 @@ class UnknownResponse(Response):
         :rtype: bool
         """
         # check crc
-        pcrc = struct.unpack('>H', self.response[-2:])[0]
-        return f_crc_m(self.response[:-2]) == pcrc
+        if len(self.response) < 2:
+            return False
+        pcrc = _U16.unpack_from(self.response, len(self.response) - 2)[0]
+        return f_crc_m(memoryview(self.response)[:-2]) == pcrc
 
     def unpack_table(self, *args):
         """Access shared debug function"""
@@ -216,7 +346,7 @@ class UnknownResponse(Response):
 class EventsResponse(UnknownResponse):
     """ Hoymiles micro-inverter event log decode helper """
 
-    alarm_codes = {
+    alarm_codes = MappingProxyType({
             1: 'Inverter start',
             2: 'DTU command failed',
             121: 'Over temperature protection',
@@ -285,7 +415,7 @@ class EventsResponse(UnknownResponse):
             5200: 'Firmware error',
             8310: 'Shut down',
             9000: 'Microinverter is suspected of being stolen'
-            }
+            })
 
     def __init__(self, *args, **params):
         super().__init__(*args, **params)
@@ -297,20 +427,22 @@ class EventsResponse(UnknownResponse):
 
         status = self.response[:2]
 
+        local_tz = int(datetime.now(timezone.utc).astimezone().utcoffset().total_seconds())
+        get_alarm = self.alarm_codes.get
+
         chunk_size = 12
         for i_chunk in range(2, len(self.response), chunk_size):
             chunk = self.response[i_chunk:i_chunk+chunk_size]
 
-            print(' '.join([f'{byte:02x}' for byte in chunk]) + ': ')
+            print(chunk.hex(' ') + ': ')
 
-            opcode, a_code, a_count, uptime1, uptime2 = struct.unpack('>BBHHH', chunk[0:8])
-            a_text = self.alarm_codes.get(a_code, 'N/A')
+            opcode, a_code, a_count, uptime1, uptime2 = _EV_HDR.unpack_from(chunk)
+            a_text = get_alarm(a_code, 'N/A')
 
-            local_tz = datetime.utcnow().astimezone().utcoffset().seconds
             print(f' uptime1={timedelta(seconds=uptime1 + local_tz)} uptime2={timedelta(seconds=uptime2 + local_tz if uptime2 > 0 else 0)} a_count={a_count} opcode={opcode} a_code={a_code} a_text={a_text}')
 
-            for fmt in ['BBHHHHH']:
-                print(f' {fmt:7}: ' + str(struct.unpack('>' + fmt, chunk)))
+            for fmt in [_EV_FULL]:
+                print(f' {fmt.format[1:]:7}: ' + str(fmt.unpack(chunk)))
             print(end='', flush=True)
 
 class DebugDecodeAny(UnknownResponse):
@@ -334,15 +466,15 @@ class DebugDecodeAny(UnknownResponse):
 
         print()
         print('Field view: int')
-        print_table_unpack('>B', self.response)
+        print_table_unpack(_U8, self.response)
 
         print()
         print('Field view: shorts')
-        print_table_unpack('>H', self.response)
+        print_table_unpack(_U16, self.response)
 
         print()
         print('Field view: longs')
-        print_table_unpack('>L', self.response)
+        print_table_unpack(_U32, self.response)
 
         try:
             if len(self.response) > 2:
@@ -356,56 +488,32 @@ class DebugDecodeAny(UnknownResponse):
         except UnicodeDecodeError:
             print(' type ascii  : ascii decode error')
 
-        print([t_char[0].decode() if ord(t_char[0]) >= 32 and ord(t_char[0]) < 127 else '' for t_char in struct.iter_unpack('>c', self.response)])
+        print(' type chars  : ' + self.response.translate(_PRINTABLE_TBL).decode('ascii'))
 
 # 1121-Series Intervers, 1 MPPT, 1 Phase
+HM300_FIELDS = MappingProxyType({
+        'dc_voltage_0': (_U16, 2, 10),            # String 1 VDC
+        'dc_current_0': (_U16, 4, 100),           # String 1 ampere
+        'dc_power_0': (_U16, 6, 10),              # String 1 watts
+        'dc_energy_total_0': (_U32, 8, None),     # String 1 total energy in Wh
+        'dc_energy_daily_0': (_U16, 12, None),    # String 1 daily energy in Wh
+        'ac_voltage_0': (_U16, 14, 10),           # Phase 1 VAC
+        'ac_current_0': (_U16, 22, 100),          # Phase 1 ampere
+        'ac_power_0': (_U16, 18, 10),             # Phase 1 watts
+        'frequency': (_U16, 16, 100),             # Grid frequency in Hertz
+        'temperature': (_U16, 26, 10),            # Inverter temperature in °C
+        })
+
 class Hm300Decode02(EventsResponse):
     """ Inverter generic events log """
 
 class Hm300Decode0B(StatusResponse):
     """ 1121-series mirco-inverters status data """
 
-    @property
-    def dc_voltage_0(self):
-        """ String 1 VDC """
-        return self.unpack('>H', 2)[0]/10
-    @property
-    def dc_current_0(self):
-        """ String 1 ampere """
-        return self.unpack('>H', 4)[0]/100
-    @property
-    def dc_power_0(self):
-        """ String 1 watts """
-        return self.unpack('>H', 6)[0]/10
-    @property
-    def dc_energy_total_0(self):
-        """ String 1 total energy in Wh """
-        return self.unpack('>L', 8)[0]
-    @property
-    def dc_energy_daily_0(self):
-        """ String 1 daily energy in Wh """
-        return self.unpack('>H', 12)[0]
+    n_phases = 1
+    n_strings = 1
 
-    @property
-    def ac_voltage_0(self):
-        """ Phase 1 VAC """
-        return self.unpack('>H', 14)[0]/10
-    @property
-    def ac_current_0(self):
-        """ Phase 1 ampere """
-        return self.unpack('>H', 22)[0]/100
-    @property
-    def ac_power_0(self):
-        """ Phase 1 watts """
-        return self.unpack('>H', 18)[0]/10
-    @property
-    def frequency(self):
-        """ Grid frequency in Hertz """
-        return self.unpack('>H', 16)[0]/100
-    @property
-    def temperature(self):
-        """ Inverter temperature in °C """
-        return self.unpack('>H', 26)[0]/10
+    _fields = HM300_FIELDS
 
 class Hm300Decode11(EventsResponse):
     """ Inverter generic events log """
@@ -415,82 +523,36 @@ class Hm300Decode12(EventsResponse):
 
 
 # 1141-Series Inverters, 2 MPPT, 1 Phase
+HM600_FIELDS = MappingProxyType({
+        'dc_voltage_0': (_U16, 2, 10),            # String 1 VDC
+        'dc_current_0': (_U16, 4, 100),           # String 1 ampere
+        'dc_power_0': (_U16, 6, 10),              # String 1 watts
+        'dc_energy_total_0': (_U32, 14, None),    # String 1 total energy in Wh
+        'dc_energy_daily_0': (_U16, 22, None),    # String 1 daily energy in Wh
+        'dc_voltage_1': (_U16, 8, 10),            # String 2 VDC
+        'dc_current_1': (_U16, 10, 100),          # String 2 ampere
+        'dc_power_1': (_U16, 12, 10),             # String 2 watts
+        'dc_energy_total_1': (_U32, 18, None),    # String 2 total energy in Wh
+        'dc_energy_daily_1': (_U16, 24, None),    # String 2 daily energy in Wh
+        'ac_voltage_0': (_U16, 26, 10),           # Phase 1 VAC
+        'ac_current_0': (_U16, 34, 10),           # Phase 1 ampere
+        'ac_power_0': (_U16, 30, 10),             # Phase 1 watts
+        'frequency': (_U16, 28, 100),             # Grid frequency in Hertz
+        'powerfactor': (_U16, 36, 1000),          # Powerfactor
+        'temperature': (_U16, 38, 10),            # Inverter temperature in °C
+        'event_count': (_U16, 40, None),          # Event counter
+        })
+
 class Hm600Decode02(EventsResponse):
     """ Inverter generic events log """
 
 class Hm600Decode0B(StatusResponse):
     """ 1141-series mirco-inverters status data """
 
-    @property
-    def dc_voltage_0(self):
-        """ String 1 VDC """
-        return self.unpack('>H', 2)[0]/10
-    @property
-    def dc_current_0(self):
-        """ String 1 ampere """
-        return self.unpack('>H', 4)[0]/100
-    @property
-    def dc_power_0(self):
-        """ String 1 watts """
-        return self.unpack('>H', 6)[0]/10
-    @property
-    def dc_energy_total_0(self):
-        """ String 1 total energy in Wh """
-        return self.unpack('>L', 14)[0]
-    @property
-    def dc_energy_daily_0(self):
-        """ String 1 daily energy in Wh """
-        return self.unpack('>H', 22)[0]
-
-    @property
-    def dc_voltage_1(self):
-        """ String 2 VDC """
-        return self.unpack('>H', 8)[0]/10
-    @property
-    def dc_current_1(self):
-        """ String 2 ampere """
-        return self.unpack('>H', 10)[0]/100
-    @property
-    def dc_power_1(self):
-        """ String 2 watts """
-        return self.unpack('>H', 12)[0]/10
-    @property
-    def dc_energy_total_1(self):
-        """ String 2 total energy in Wh """
-        return self.unpack('>L', 18)[0]
-    @property
-    def dc_energy_daily_1(self):
-        """ String 2 daily energy in Wh """
-        return self.unpack('>H', 24)[0]
+    n_phases = 1
+    n_strings = 2
 
-    @property
-    def ac_voltage_0(self):
-        """ Phase 1 VAC """
-        return self.unpack('>H', 26)[0]/10
-    @property
-    def ac_current_0(self):
-        """ Phase 1 ampere """
-        return self.unpack('>H', 34)[0]/10
-    @property
-    def ac_power_0(self):
-        """ Phase 1 watts """
-        return self.unpack('>H', 30)[0]/10
-    @property
-    def frequency(self):
-        """ Grid frequency in Hertz """
-        return self.unpack('>H', 28)[0]/100
-    @property
-    def powerfactor(self):
-        """ Powerfactor """
-        return self.unpack('>H', 36)[0]/1000
-    @property
-    def temperature(self):
-        """ Inverter temperature in °C """
-        return self.unpack('>H', 38)[0]/10
-    @property
-    def event_count(self):
-        """ Event counter """
-        return self.unpack('>H', 40)[0]
+    _fields = HM600_FIELDS
 
 class Hm600Decode11(EventsResponse):
     """ Inverter generic events log """
@@ -500,124 +562,46 @@ class Hm600Decode12(EventsResponse):
 
 
 # 1161-Series Inverters, 2 MPPT, 1 Phase
+HM1200_FIELDS = MappingProxyType({
+        'dc_voltage_0': (_U16, 2, 10),            # String 1 VDC
+        'dc_current_0': (_U16, 4, 100),           # String 1 ampere
+        'dc_power_0': (_U16, 8, 10),              # String 1 watts
+        'dc_energy_total_0': (_U32, 12, None),    # String 1 total energy in Wh
+        'dc_energy_daily_0': (_U16, 20, None),    # String 1 daily energy in Wh
+        'dc_voltage_1': (_U16, 2, 10),            # String 2 VDC, shares MPPT 1
+        'dc_current_1': (_U16, 6, 100),           # String 2 ampere
+        'dc_power_1': (_U16, 10, 10),             # String 2 watts
+        'dc_energy_total_1': (_U32, 16, None),    # String 2 total energy in Wh
+        'dc_energy_daily_1': (_U16, 22, None),    # String 2 daily energy in Wh
+        'dc_voltage_2': (_U16, 24, 10),           # String 3 VDC
+        'dc_current_2': (_U16, 26, 100),          # String 3 ampere
+        'dc_power_2': (_U16, 30, 10),             # String 3 watts
+        'dc_energy_total_2': (_U32, 34, None),    # String 3 total energy in Wh
+        'dc_energy_daily_2': (_U16, 42, None),    # String 3 daily energy in Wh
+        'dc_voltage_3': (_U16, 24, 10),           # String 4 VDC, shares MPPT 2
+        'dc_current_3': (_U16, 28, 100),          # String 4 ampere
+        'dc_power_3': (_U16, 32, 10),             # String 4 watts
+        'dc_energy_total_3': (_U32, 38, None),    # String 4 total energy in Wh
+        'dc_energy_daily_3': (_U16, 44, None),    # String 4 daily energy in Wh
+        'ac_voltage_0': (_U16, 46, 10),           # Phase 1 VAC
+        'ac_current_0': (_U16, 54, 100),          # Phase 1 ampere
+        'ac_power_0': (_U16, 50, 10),             # Phase 1 watts
+        'frequency': (_U16, 48, 100),             # Grid frequency in Hertz
+        'powerfactor': (_U16, 56, 1000),          # Powerfactor
+        'temperature': (_U16, 58, 10),            # Inverter temperature in °C
+        'event_count': (_U16, 60, None),          # Event counter
+        })
+
 class Hm1200Decode02(EventsResponse):
     """ Inverter generic events log """
 
 class Hm1200Decode0B(StatusResponse):
     """ 1161-series mirco-inverters status data """
 
-    @property
-    def dc_voltage_0(self):
-        """ String 1 VDC """
-        return self.unpack('>H', 2)[0]/10
-    @property
-    def dc_current_0(self):
-        """ String 1 ampere """
-        return self.unpack('>H', 4)[0]/100
-    @property
-    def dc_power_0(self):
-        """ String 1 watts """
-        return self.unpack('>H', 8)[0]/10
-    @property
-    def dc_energy_total_0(self):
-        """ String 1 total energy in Wh """
-        return self.unpack('>L', 12)[0]
-    @property
-    def dc_energy_daily_0(self):
-        """ String 1 daily energy in Wh """
-        return self.unpack('>H', 20)[0]
+    n_phases = 1
+    n_strings = 4
 
-    @property
-    def dc_voltage_1(self):
-        """ String 2 VDC """
-        return self.unpack('>H', 2)[0]/10
-    @property
-    def dc_current_1(self):
-        """ String 2 ampere """
-        return self.unpack('>H', 6)[0]/100
-    @property
-    def dc_power_1(self):
-        """ String 2 watts """
-        return self.unpack('>H', 10)[0]/10
-    @property
-    def dc_energy_total_1(self):
-        """ String 2 total energy in Wh """
-        return self.unpack('>L', 16)[0]
-    @property
-    def dc_energy_daily_1(self):
-        """ String 2 daily energy in Wh """
-        return self.unpack('>H', 22)[0]
-
-    @property
-    def dc_voltage_2(self):
-        """ String 3 VDC """
-        return self.unpack('>H', 24)[0]/10
-    @property
-    def dc_current_2(self):
-        """ String 3 ampere """
-        return self.unpack('>H', 26)[0]/100
-    @property
-    def dc_power_2(self):
-        """ String 3 watts """
-        return self.unpack('>H', 30)[0]/10
-    @property
-    def dc_energy_total_2(self):
-        """ String 3 total energy in Wh """
-        return self.unpack('>L', 34)[0]
-    @property
-    def dc_energy_daily_2(self):
-        """ String 3 daily energy in Wh """
-        return self.unpack('>H', 42)[0]
-
-    @property
-    def dc_voltage_3(self):
-        """ String 4 VDC """
-        return self.unpack('>H', 24)[0]/10
-    @property
-    def dc_current_3(self):
-        """ String 4 ampere """
-        return self.unpack('>H', 28)[0]/100
-    @property
-    def dc_power_3(self):
-        """ String 4 watts """
-        return self.unpack('>H', 32)[0]/10
-    @property
-    def dc_energy_total_3(self):
-        """ String 4 total energy in Wh """
-        return self.unpack('>L', 38)[0]
-    @property
-    def dc_energy_daily_3(self):
-        """ String 4 daily energy in Wh """
-        return self.unpack('>H', 44)[0]
-
-    @property
-    def ac_voltage_0(self):
-        """ Phase 1 VAC """
-        return self.unpack('>H', 46)[0]/10
-    @property
-    def ac_current_0(self):
-        """ Phase 1 ampere """
-        return self.unpack('>H', 54)[0]/100
-    @property
-    def ac_power_0(self):
-        """ Phase 1 watts """
-        return self.unpack('>H', 50)[0]/10
-    @property
-    def frequency(self):
-        """ Grid frequency in Hertz """
-        return self.unpack('>H', 48)[0]/100
-    @property
-    def powerfactor(self):
-        """ Powerfactor """
-        return self.unpack('>H', 56)[0]/1000
-    @property
-    def temperature(self):
-        """ Inverter temperature in °C """
-        return self.unpack('>H', 58)[0]/10
-    @property
-    def event_count(self):
-        """ Event counter """
-        return self.unpack('>H', 60)[0]
+    _fields = HM1200_FIELDS
 
 class Hm1200Decode11(EventsResponse):
     """ Inverter generic events log """
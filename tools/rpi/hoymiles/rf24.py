@@ -11,38 +11,55 @@ SPDX-License-Identifier: GPL-2.0-only
 import time
 import re
 from datetime import datetime
-import spidev
-import board
-from digitalio import DigitalInOut
+from importlib import import_module
+
+# Supported nRF24 drivers in order of preference: (LIB_RF24 name, module)
+RF24_BACKENDS = (
+        ('TMRh20', 'RF24'),
+        ('Circuitpython', 'circuitpython_nrf24l01.rf24'),
+        )
+
+def _pick_backend():
+    """
+    Import the first available nRF24 driver
+
+    :return: backend name and driver module, (None, None) if none is installed
+    :rtype: tuple
+    """
+    for name, module in RF24_BACKENDS:
+        try:
+            return name, import_module(module)
+        except ImportError:
+            pass
+    return None, None
+
+LIB_RF24, _rf24_lib = _pick_backend()
 
-LIB_RF24 = None
+# Use RF24 Library from TMRh20
+if LIB_RF24 == 'TMRh20':
+    from RF24 import RF24, RF24_250KBPS, \
+            RF24_PA_MIN, RF24_PA_LOW, RF24_PA_HIGH, RF24_PA_MAX, \
+            RF24_CRC_DISABLED, RF24_CRC_8, RF24_CRC_16
 
+elif LIB_RF24 == 'Circuitpython':
+    import spidev
+    import board
+    from digitalio import DigitalInOut
+
+    CircuitpythonRF24 = _rf24_lib.RF24
+
+    # Board pins by number, resolved once: SPI chip selects and GPIOs
+    _BOARD_CE = {n: getattr(board, f'CE{n}') for n in range(2) if hasattr(board, f'CE{n}')}
+    _BOARD_D = {n: getattr(board, f'D{n}') for n in range(28) if hasattr(board, f'D{n}')}
 
-# Use RF24 Library from TMRh20
-try:
-    if not LIB_RF24:
-        from RF24 import RF24, RF24_250KBPS, \
-                RF24_PA_MIN, RF24_PA_LOW, RF24_PA_HIGH, RF24_PA_MAX, \
-                RF24_250KBPS, RF24_CRC_DISABLED, RF24_CRC_8, RF24_CRC_16
-        LIB_RF24 = 'TRMh20'
-except ImportError:
-    pass
-
-try:
-    if not LIB_RF24:
-        from circuitpython_nrf24l01.rf24 import RF24 as CircuitpythonRF24
-        LIB_RF42 = 'Circuitpython'
-except ImportError:
-    pass
-
-if LIB_RF24 == 'Circuitpython':
     RF24_PA_MIN = -18
     RF24_PA_LOW = -12
     RF24_PA_HIGH = -6
     RF24_PA_MAX = 0
 
+    # crc attribute takes the CRC length in bytes
     RF24_CRC_DISABLED = 0
-    RF24_CRC_16 = 1
+    RF24_CRC_8 = 1
     RF24_CRC_16 = 2
 
     RF24_250KBPS = 250
@@ -60,8 +77,8 @@ if LIB_RF24 == 'Circuitpython':
         def __init__(self, ce: int, cs: int, speed: int) -> None:
             """Init"""
             spi = spidev.SpiDev()
-            cs = DigitalInOut(getattr(board, f'CE{cs}'))
-            ce = DigitalInOut(getattr(board, f'D{ce}'))
+            cs = DigitalInOut(_BOARD_CE[cs])
+            ce = DigitalInOut(_BOARD_D[ce])
             super().__init__(spi, cs, ce, spi_frequency=speed)
 
         def begin(self) -> bool:
@@ -69,7 +86,8 @@ if LIB_RF24 == 'Circuitpython':
             :return: if success
             :rtype: True or None
             """
-            self.interrupt_config(False, False, False)
+            # Only data ready drives the IRQ line, HoymilesNRF may wait on it
+            self.interrupt_config(True, False, False)
             self.address_length = 5
             self.allow_ask_no_ack = False
             self.power = True
@@ -90,9 +108,8 @@ if LIB_RF24 == 'Circuitpython':
             """
             self.data_rate = rate
 
-        def setAutoAck(self, enable, pipe=0) -> None:
-            """alias for set_auto_ack"""
-            self.auto_ack = enable
+        def setAutoAck(self, enable, pipe=None) -> None:
+            """alias for set_auto_ack, all pipes unless pipe is given"""
             self.set_auto_ack(enable, pipe)
         def getAutoAck(self, pipe=0) -> bool:
             """alias for get_auto_ack"""